@@ -25,6 +25,10 @@ setup(
     packages=find_packages(exclude=["tests", "tests.*"]),
     package_data={"vedro_telemetry": ["py.typed"]},
     install_requires=find_required(),
+    extras_require={
+        "orjson": ["orjson>=3.0,<4.0"],
+        "zstd": ["zstandard>=0.15,<1.0"],
+    },
     tests_require=find_dev_required(),
     classifiers=[
         "License :: OSI Approved :: Apache Software License",
@@ -1,8 +1,8 @@
 import sys
+from functools import lru_cache
 from pathlib import Path
-from time import monotonic_ns
 from types import TracebackType
-from typing import Any, Dict, cast
+from typing import Any, Dict, Tuple, Type, cast
 from unittest.mock import Mock
 
 import pytest
@@ -19,10 +19,20 @@ from vedro.core import (
 
 from vedro_telemetry import VedroTelemetry, VedroTelemetryPlugin
 
-__all__ = ("dispatcher", "config", "plugin", "send_request_", "report_",
+__all__ = ("dispatcher", "config", "plugin", "send_request_", "reset_send_request_", "report_",
            "make_vscenario", "make_exc_info", "make_vstep", "get_telemetry_event",
            "assert_telemetry_event",)
 
+_CWD = Path.cwd()
+# Tracebacks are reused only for equal exceptions; ExcInfo always wraps the given instance
+_TRACEBACK_CACHE: Dict[Tuple[Type[BaseException], str], TracebackType] = {}
+
+
+class _Conf(Config):
+    class Plugins(Config.Plugins):
+        class VedroTelemetry(VedroTelemetry):
+            enabled = True
+
 
 @pytest.fixture()
 def dispatcher() -> Dispatcher:
@@ -31,19 +41,20 @@ def dispatcher() -> Dispatcher:
 
 @pytest.fixture()
 def config() -> ConfigType:
-    class Conf(Config):
-        class Plugins(Config.Plugins):
-            class VedroTelemetry(VedroTelemetry):
-                enabled = True
-    return Conf
+    return _Conf
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def send_request_() -> Mock:
     response = 200, {}
     return Mock(return_value=response)
 
 
+@pytest.fixture(autouse=True)
+def reset_send_request_(send_request_: Mock) -> None:
+    send_request_.reset_mock()
+
+
 @pytest.fixture()
 def plugin(dispatcher: Dispatcher, send_request_) -> VedroTelemetryPlugin:
     plugin = VedroTelemetryPlugin(VedroTelemetry, send_request=send_request_)
@@ -56,11 +67,15 @@ def report_() -> Mock:
     return Mock(Report, total=6, passed=3, failed=2, skipped=1, interrupted=None)
 
 
-def make_vscenario() -> VirtualScenario:
+@lru_cache(maxsize=None)
+def _make_scenario(index: int) -> Type[Scenario_]:
     class Scenario(Scenario_):
-        __file__ = Path(f"scenario_{monotonic_ns()}.py").absolute()
+        __file__ = _CWD / f"scenario_{index}.py"
+    return Scenario
+
 
-    vsenario = VirtualScenario(Scenario, steps=[])
+def make_vscenario(index: int) -> VirtualScenario:
+    vsenario = VirtualScenario(_make_scenario(index), steps=[])
     return vsenario
 
 
@@ -71,34 +86,33 @@ def make_vstep() -> VirtualStep:
 
 
 def make_exc_info(exc_val: BaseException) -> ExcInfo:
-    try:
-        raise exc_val
-    except type(exc_val):
-        *_, traceback = sys.exc_info()
-    return ExcInfo(type(exc_val), exc_val, cast(TracebackType, traceback))
+    key = (type(exc_val), str(exc_val))
+    if key not in _TRACEBACK_CACHE:
+        try:
+            raise exc_val
+        except type(exc_val):
+            *_, traceback = sys.exc_info()
+        _TRACEBACK_CACHE[key] = cast(TracebackType, traceback)
+    return ExcInfo(type(exc_val), exc_val, _TRACEBACK_CACHE[key])
 
 
 def get_telemetry_event(mock: Mock) -> Dict[str, Any]:
-    # send_request call
-    assert len(mock.call_args_list) == 1, mock.call_args_list
-    arg_list = mock.call_args_list[0]
+    # single send_request call
+    (send_request_call,) = mock.call_args_list
 
     # send_request call args (url, timeout, payload)
-    assert len(arg_list.args) == 3, arg_list.args
-    last_arg = arg_list.args[-1]
+    (_, _, payload) = send_request_call.args
 
     # first event in payload
-    assert len(last_arg) >= 1, last_arg
-    return last_arg[0]
+    assert payload, payload
+    return payload[0]
 
 
 def assert_telemetry_event(telemetry_event, body: Dict[str, Any]) -> bool:
     assert isinstance(telemetry_event["session_id"], str)
     assert isinstance(telemetry_event["created_at"], int)
-    expected = {
-        "session_id": telemetry_event["session_id"],
-        "created_at": telemetry_event["created_at"],
-        **body,
-    }
-    assert telemetry_event == expected, (telemetry_event, expected)
+    # session_id and created_at are checked above, the rest must match the body exactly
+    assert len(telemetry_event) == len(body) + 2, (telemetry_event, body)
+    for key, val in body.items():
+        assert telemetry_event[key] == val, (key, telemetry_event, body)
     return True
@@ -1,3 +1,4 @@
+import pickle
 from uuid import uuid4
 
 from baby_steps import given, then, when
@@ -14,7 +15,7 @@ from vedro_telemetry.events import (
 
 def test_started_telemetry_event_repr():
     with given:
-        session_id = uuid4()
+        session_id = str(uuid4())
         project_id = "test"
         inited_at = 0
         event = StartedTelemetryEvent(session_id, project_id, inited_at,
@@ -24,13 +25,13 @@ def test_started_telemetry_event_repr():
         res = repr(event)
 
     with then:
-        assert res == (f"<StartedTelemetryEvent session_id={str(session_id)!r} "
+        assert res == (f"<StartedTelemetryEvent session_id={session_id!r} "
                        f"project_id={project_id!r}>")
 
 
 def test_arg_parse_telemetry_event_repr():
     with given:
-        session_id = uuid4()
+        session_id = str(uuid4())
         cmd = ["--help"]
         event = ArgParseTelemetryEvent(session_id, cmd)
 
@@ -38,12 +39,12 @@ def test_arg_parse_telemetry_event_repr():
         res = repr(event)
 
     with then:
-        assert res == f"<ArgParseTelemetryEvent session_id={str(session_id)!r} cmd={cmd!r}>"
+        assert res == f"<ArgParseTelemetryEvent session_id={session_id!r} cmd={cmd!r}>"
 
 
 def test_arg_parsed_telemetry_event_repr():
     with given:
-        session_id = uuid4()
+        session_id = str(uuid4())
         args = {"--help": True}
         event = ArgParsedTelemetryEvent(session_id, args)
 
@@ -51,12 +52,12 @@ def test_arg_parsed_telemetry_event_repr():
         res = repr(event)
 
     with then:
-        assert res == f"<ArgParsedTelemetryEvent session_id={str(session_id)!r} args={args!r}>"
+        assert res == f"<ArgParsedTelemetryEvent session_id={session_id!r} args={args!r}>"
 
 
 def test_startup_telemetry_event_repr():
     with given:
-        session_id = uuid4()
+        session_id = str(uuid4())
         discovered, scheduled = 1, 0
         event = StartupTelemetryEvent(session_id, discovered=discovered, scheduled=scheduled)
 
@@ -64,13 +65,13 @@ def test_startup_telemetry_event_repr():
         res = repr(event)
 
     with then:
-        assert res == (f"<StartupTelemetryEvent session_id={str(session_id)!r} "
+        assert res == (f"<StartupTelemetryEvent session_id={session_id!r} "
                        f"discovered={discovered!r} scheduled={scheduled!r}>")
 
 
 def test_exc_raised_telemetry_event_repr():
     with given:
-        session_id = uuid4()
+        session_id = str(uuid4())
         scenario_id = "scenarios/scenario.py::Scenario"
         event = ExcRaisedTelemetryEvent(session_id, scenario_id, {
             "type": "builtins.AssertionError",
@@ -82,13 +83,13 @@ def test_exc_raised_telemetry_event_repr():
         res = repr(event)
 
     with then:
-        assert res == (f"<ExcRaisedTelemetryEvent session_id={str(session_id)!r} "
+        assert res == (f"<ExcRaisedTelemetryEvent session_id={session_id!r} "
                        f"scenario_id={scenario_id!r} exc_type='builtins.AssertionError'>")
 
 
 def test_ended_telemetry_event_repr():
     with given:
-        session_id = uuid4()
+        session_id = str(uuid4())
         total, passed, failed, skipped = 6, 3, 2, 1
         event = EndedTelemetryEvent(session_id, total=total, passed=passed,
                                     failed=failed, skipped=skipped, interrupted=None)
@@ -97,6 +98,54 @@ def test_ended_telemetry_event_repr():
         res = repr(event)
 
     with then:
-        assert res == (f"<EndedTelemetryEvent session_id={str(session_id)!r} "
+        assert res == (f"<EndedTelemetryEvent session_id={session_id!r} "
                        f"total={total} passed={passed} failed={failed} "
                        f"skipped={skipped} is_interrupted=False>")
+
+
+def test_telemetry_event_has_no_dict():
+    with given:
+        event = StartupTelemetryEvent(str(uuid4()), discovered=1, scheduled=1)
+
+    with when:
+        has_dict = hasattr(event, "__dict__")
+
+    with then:
+        assert has_dict is False
+
+
+def test_telemetry_event_to_tuple():
+    with given:
+        event = EndedTelemetryEvent(str(uuid4()), total=6, passed=3, failed=2, skipped=1,
+                                    interrupted=None)
+
+    with when:
+        res = event.to_tuple()
+
+    with then:
+        assert dict(zip(event.fields, res)) == event.to_dict()
+
+
+def test_telemetry_event_fast_new():
+    with given:
+        session_id = str(uuid4())
+        event = StartupTelemetryEvent(session_id, discovered=1, scheduled=0)
+
+    with when:
+        res = StartupTelemetryEvent._fast_new(session_id, event._created_at, 1, 0)
+
+    with then:
+        assert res.to_dict() == event.to_dict()
+
+
+def test_telemetry_event_pickle():
+    with given:
+        event = EndedTelemetryEvent(str(uuid4()), total=6, passed=3, failed=2, skipped=1,
+                                    interrupted=None, dropped_events=1)
+
+    with when:
+        res = pickle.loads(pickle.dumps(event))
+
+    with then:
+        assert type(res) is EndedTelemetryEvent
+        assert res.to_dict() == event.to_dict()
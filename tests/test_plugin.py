@@ -1,10 +1,15 @@
+import json
 import sys
+import time
 from argparse import ArgumentParser, Namespace
+from asyncio import sleep
 from pathlib import Path
+from typing import Any, Dict, List
 from unittest.mock import Mock, call, patch
 
+import pytest
 from baby_steps import given, then, when
-from vedro.core import ConfigType, Dispatcher
+from vedro.core import ConfigType, Dispatcher, ExcInfo
 from vedro.core import MonotonicScenarioScheduler as Scheduler
 from vedro.core import Report, ScenarioResult, StepResult
 from vedro.events import (
@@ -16,7 +21,8 @@ from vedro.events import (
     StartupEvent,
 )
 
-from vedro_telemetry import VedroTelemetryPlugin
+from vedro_telemetry import VedroTelemetry, VedroTelemetryPlugin
+from vedro_telemetry._send_request import TelemetryRequestError
 from vedro_telemetry._utils import get_package_version
 
 from ._utils import (
@@ -29,10 +35,14 @@ from ._utils import (
     make_vstep,
     plugin,
     report_,
+    reset_send_request_,
     send_request_,
 )
 
-__all__ = ("plugin", "dispatcher", "config", "send_request_", "report_")  # fixtures
+__all__ = ("plugin", "dispatcher", "config", "send_request_", "reset_send_request_",
+           "report_")  # fixtures
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
 
 async def test_started_telemetry(*, plugin: VedroTelemetryPlugin, dispatcher: Dispatcher,
@@ -101,10 +111,43 @@ async def test_arg_parsed_event(*, plugin: VedroTelemetryPlugin, dispatcher: Dis
         })
 
 
+@pytest.mark.parametrize(("argv", "expected_args"), [
+    (["-v", "scenarios/"], {"--verbose": True, "file_or_dir": ["scenarios/"]}),
+    # --verbose and --quiet share the same dest, the non-default one is reported
+    ([], {"--quiet": False}),
+])
+async def test_arg_parsed_event_with_args(argv: List[str], expected_args: Dict[str, Any], *,
+                                          plugin: VedroTelemetryPlugin,
+                                          dispatcher: Dispatcher, send_request_: Mock):
+    with given:
+        arg_parser = ArgumentParser()
+        arg_parser.add_argument("-v", "--verbose", action="store_true")
+        arg_parser.add_argument("--quiet", dest="verbose", action="store_false")
+        arg_parser.add_argument("--subject", default=None)
+        arg_parser.add_argument("file_or_dir", nargs="*", default=["."])
+
+        with patch("sys.argv", ["prog", *argv]):
+            await dispatcher.fire(ArgParseEvent(arg_parser))
+
+        args = arg_parser.parse_args(argv)
+        await dispatcher.fire(ArgParsedEvent(args))
+
+    with when:
+        await dispatcher.fire(CleanupEvent(Report()))
+
+    with then:
+        (send_request_call,) = send_request_.call_args_list
+        _, arg_parsed_event, *_ = send_request_call.args[-1]
+        assert assert_telemetry_event(arg_parsed_event, {
+            "event_id": "ArgParsedTelemetryEvent",
+            "args": expected_args,
+        })
+
+
 async def test_startup_event(*, plugin: VedroTelemetryPlugin, dispatcher: Dispatcher,
                              send_request_: Mock):
     with given:
-        scenarios = [make_vscenario(), make_vscenario(), make_vscenario()]
+        scenarios = [make_vscenario(0), make_vscenario(1), make_vscenario(2)]
         scheduler = Scheduler(scenarios)
         scheduler.ignore(scenarios[0])
 
@@ -128,7 +171,7 @@ async def test_raised_exc_event(*, plugin: VedroTelemetryPlugin, dispatcher: Dis
     with given:
         exc_info = make_exc_info(AssertionError("1 != 0"))
 
-        scenario_result = ScenarioResult(make_vscenario())
+        scenario_result = ScenarioResult(make_vscenario(0))
         step_result = StepResult(make_vstep()).set_exc_info(exc_info)
         scenario_result.add_step_result(step_result)
 
@@ -147,12 +190,38 @@ async def test_raised_exc_event(*, plugin: VedroTelemetryPlugin, dispatcher: Dis
                 "type": "builtins.AssertionError",
                 "message": "1 != 0",
                 "traceback": [
-                    '  File "./tests/_utils.py", line 75, in make_exc_info\n    raise exc_val\n'
+                    '  File "./tests/_utils.py", line 92, in make_exc_info\n    raise exc_val\n'
                 ]
             }
         })
 
 
+async def test_raised_exc_event_with_separator(*, plugin: VedroTelemetryPlugin,
+                                               dispatcher: Dispatcher, send_request_: Mock):
+    with given:
+        # The record separator that joins the frames, as part of a file name
+        filename = str(Path.cwd().resolve() / "scenario\x1e.py")
+        try:
+            exec(compile("raise AssertionError()", filename, "exec"))
+        except AssertionError:
+            exc_info = ExcInfo(*sys.exc_info())
+
+        scenario_result = ScenarioResult(make_vscenario(0))
+        step_result = StepResult(make_vstep()).set_exc_info(exc_info)
+        scenario_result.add_step_result(step_result)
+
+        await dispatcher.fire(ScenarioFailedEvent(scenario_result))
+
+    with when:
+        await dispatcher.fire(CleanupEvent(Report()))
+
+    with then:
+        telemetry_event = get_telemetry_event(send_request_)
+        test_frame, scenario_frame = telemetry_event["exception"]["traceback"]
+        assert test_frame.startswith('  File "./tests/test_plugin.py", line ')
+        assert scenario_frame == '  File "./scenario\x1e.py", line 1, in <module>\n'
+
+
 async def test_ended_telemetry(*, plugin: VedroTelemetryPlugin, dispatcher: Dispatcher,
                                config: ConfigType, report_: Mock, send_request_: Mock):
     with given:
@@ -172,7 +241,298 @@ async def test_ended_telemetry(*, plugin: VedroTelemetryPlugin, dispatcher: Disp
             "failed": report_.failed,
             "skipped": report_.skipped,
             "interrupted": None,
+            "dropped_events": 0,
         })
         assert send_request_.mock_calls == [
             call(api_url, timeout, [telemetry_event])
         ]
+
+
+async def test_flush_on_max_batch_size(*, dispatcher: Dispatcher, send_request_: Mock):
+    with given:
+        class _VedroTelemetry(VedroTelemetry):
+            max_batch_size = 2
+
+        plugin = VedroTelemetryPlugin(_VedroTelemetry, send_request=send_request_)
+        plugin.subscribe(dispatcher)
+
+        await dispatcher.fire(ArgParsedEvent(Namespace()))
+        await dispatcher.fire(ArgParsedEvent(Namespace()))
+
+    with when:
+        await dispatcher.fire(CleanupEvent(Report()))
+
+    with then:
+        batches = [c.args[-1] for c in send_request_.call_args_list]
+        assert [[e["event_id"] for e in batch] for batch in batches] == [
+            ["ArgParsedTelemetryEvent", "ArgParsedTelemetryEvent"],
+            ["EndedTelemetryEvent"],
+        ]
+
+
+@pytest.mark.parametrize(("option", "value"), [
+    ("max_batch_size", 0),
+    ("flush_interval_ms", 0),
+    ("flush_interval_ms", -1),
+    ("max_buffered_events", 0),
+])
+async def test_invalid_flush_options(option: str, value: int):
+    with given:
+        _VedroTelemetry = type("_VedroTelemetry", (VedroTelemetry,), {option: value})
+
+    with when, pytest.raises(ValueError) as exc:
+        VedroTelemetryPlugin(_VedroTelemetry)
+
+    with then:
+        assert str(exc.value) == f"{option} must be positive, got {value!r}"
+
+
+async def test_flush_on_interval(*, dispatcher: Dispatcher, config: ConfigType,
+                                 send_request_: Mock):
+    with given:
+        class _VedroTelemetry(VedroTelemetry):
+            flush_interval_ms = 10
+
+        plugin = VedroTelemetryPlugin(_VedroTelemetry, send_request=send_request_)
+        plugin.subscribe(dispatcher)
+
+        await dispatcher.fire(ConfigLoadedEvent(Path(), config))
+
+    with when:
+        for _ in range(100):
+            if send_request_.called:
+                break
+            await sleep(0.01)
+        await dispatcher.fire(CleanupEvent(Report()))
+
+    with then:
+        batches = [c.args[-1] for c in send_request_.call_args_list]
+        assert [[e["event_id"] for e in batch] for batch in batches] == [
+            ["StartedTelemetryEvent"],
+            ["EndedTelemetryEvent"],
+        ]
+
+
+async def test_flush_timeout(*, dispatcher: Dispatcher):
+    with given:
+        class _VedroTelemetry(VedroTelemetry):
+            timeout = 0.01
+
+        send_request_ = Mock(side_effect=lambda *_: time.sleep(0.5) or (200, {}))
+        plugin = VedroTelemetryPlugin(_VedroTelemetry, send_request=send_request_)
+        plugin.subscribe(dispatcher)
+
+    with when, pytest.raises(TelemetryRequestError) as exc:
+        await dispatcher.fire(CleanupEvent(Report()))
+
+    with then:
+        assert str(exc.value) == (f"Timed out sending events to "
+                                  f"{_VedroTelemetry.api_url!r} after 0.08s")
+
+
+async def test_flush_timeout_without_exception(*, dispatcher: Dispatcher,
+                                               capsys: pytest.CaptureFixture[str]):
+    with given:
+        class _VedroTelemetry(VedroTelemetry):
+            timeout = 0.01
+            raise_exception_on_failure = False
+
+        send_request_ = Mock(side_effect=lambda *_: time.sleep(0.5) or (200, {}))
+        plugin = VedroTelemetryPlugin(_VedroTelemetry, send_request=send_request_)
+        plugin.subscribe(dispatcher)
+
+    with when:
+        await dispatcher.fire(CleanupEvent(Report()))
+
+    with then:
+        error = TelemetryRequestError(
+            f"Timed out sending events to {_VedroTelemetry.api_url!r} after 0.08s"
+        )
+        assert capsys.readouterr().err == f"[Error] {error!r}\n"
+
+
+async def test_send_failure(*, dispatcher: Dispatcher):
+    with given:
+        error = TelemetryRequestError("Failed to send events")
+        send_request_ = Mock(side_effect=error)
+        plugin = VedroTelemetryPlugin(VedroTelemetry, send_request=send_request_)
+        plugin.subscribe(dispatcher)
+
+    with when, pytest.raises(TelemetryRequestError) as exc:
+        await dispatcher.fire(CleanupEvent(Report()))
+
+    with then:
+        assert exc.value is error
+
+
+async def test_send_failure_without_exception(*, dispatcher: Dispatcher,
+                                              capsys: pytest.CaptureFixture[str]):
+    with given:
+        class _VedroTelemetry(VedroTelemetry):
+            raise_exception_on_failure = False
+
+        error = TelemetryRequestError("Failed to send events")
+        send_request_ = Mock(side_effect=error)
+        plugin = VedroTelemetryPlugin(_VedroTelemetry, send_request=send_request_)
+        plugin.subscribe(dispatcher)
+
+    with when:
+        await dispatcher.fire(CleanupEvent(Report()))
+
+    with then:
+        assert capsys.readouterr().err == f"[Error] {error!r}\n"
+
+
+async def test_flush_slower_than_timeout(*, dispatcher: Dispatcher):
+    with given:
+        class _VedroTelemetry(VedroTelemetry):
+            timeout = 0.05
+            max_batch_size = 1
+
+        # Each request takes longer than the timeout, but within the per-phase budget
+        send_request_ = Mock(side_effect=lambda *_: time.sleep(0.08) or (200, {}))
+        plugin = VedroTelemetryPlugin(_VedroTelemetry, send_request=send_request_)
+        plugin.subscribe(dispatcher)
+
+        await dispatcher.fire(ArgParsedEvent(Namespace()))
+        await dispatcher.fire(ArgParsedEvent(Namespace()))
+
+    with when:
+        await dispatcher.fire(CleanupEvent(Report()))
+
+    with then:
+        batches = [c.args[-1] for c in send_request_.call_args_list]
+        assert [[e["event_id"] for e in batch] for batch in batches] == [
+            ["ArgParsedTelemetryEvent"],
+            ["ArgParsedTelemetryEvent"],
+            ["EndedTelemetryEvent"],
+        ]
+
+
+async def test_stop_sending_after_failure(*, dispatcher: Dispatcher):
+    with given:
+        class _VedroTelemetry(VedroTelemetry):
+            max_batch_size = 2
+            timeout = 0.1
+
+        error = TelemetryRequestError("Failed to send events")
+        send_request_ = Mock(side_effect=error)
+        plugin = VedroTelemetryPlugin(_VedroTelemetry, send_request=send_request_)
+        plugin.subscribe(dispatcher)
+
+    with when, pytest.raises(TelemetryRequestError) as exc:
+        for _ in range(8):
+            await dispatcher.fire(ArgParsedEvent(Namespace()))
+        await dispatcher.fire(CleanupEvent(Report()))
+
+    with then:
+        assert exc.value is error
+        assert len(send_request_.call_args_list) == 1
+
+
+async def test_drop_oldest_events(*, dispatcher: Dispatcher, send_request_: Mock):
+    with given:
+        class _VedroTelemetry(VedroTelemetry):
+            max_buffered_events = 2
+
+        plugin = VedroTelemetryPlugin(_VedroTelemetry, send_request=send_request_)
+        plugin.subscribe(dispatcher)
+
+        with patch("sys.argv", ["prog", "run"]):
+            await dispatcher.fire(ArgParseEvent(ArgumentParser()))
+        await dispatcher.fire(ArgParsedEvent(Namespace()))
+        await dispatcher.fire(StartupEvent(Scheduler([])))
+
+    with when:
+        await dispatcher.fire(CleanupEvent(Report()))
+
+    with then:
+        (send_request_call,) = send_request_.call_args_list
+        batch = send_request_call.args[-1]
+        assert [e["event_id"] for e in batch] == [
+            "ArgParsedTelemetryEvent",
+            "StartupTelemetryEvent",
+            "EndedTelemetryEvent",
+        ]
+        assert batch[-1]["dropped_events"] == 1
+
+
+async def test_send_encoded_events(*, dispatcher: Dispatcher):
+    with given:
+        send_request_raw_ = Mock(return_value=(200, {}))
+        plugin = VedroTelemetryPlugin(VedroTelemetry, send_request_raw=send_request_raw_)
+        plugin.subscribe(dispatcher)
+
+        await dispatcher.fire(StartupEvent(Scheduler([])))
+
+    with when:
+        await dispatcher.fire(CleanupEvent(Report()))
+
+    with then:
+        (send_request_raw_call,) = send_request_raw_.call_args_list
+        url, timeout, body = send_request_raw_call.args
+        assert url == f"{VedroTelemetry.api_url}/v1/events"
+        assert [e["event_id"] for e in json.loads(body)] == [
+            "StartupTelemetryEvent",
+            "EndedTelemetryEvent",
+        ]
+
+
+async def test_no_flush_at_exit_after_cleanup(*, plugin: VedroTelemetryPlugin,
+                                              dispatcher: Dispatcher, config: ConfigType,
+                                              send_request_: Mock):
+    with given:
+        await dispatcher.fire(ConfigLoadedEvent(Path(), config))
+        await dispatcher.fire(CleanupEvent(Report()))
+        send_request_.reset_mock()
+
+    with when:
+        plugin._flush_at_exit()
+
+    with then:
+        assert send_request_.mock_calls == []
+
+
+async def test_send_compressed_events(*, dispatcher: Dispatcher):
+    with given:
+        class _VedroTelemetry(VedroTelemetry):
+            compression = "gzip"
+
+        with patch("vedro_telemetry._vedro_telemetry._send_request_raw",
+                   return_value=(200, {})) as send_request_raw_:
+            plugin = VedroTelemetryPlugin(_VedroTelemetry)
+        plugin.subscribe(dispatcher)
+
+    with when:
+        await dispatcher.fire(CleanupEvent(Report()))
+
+    with then:
+        (send_request_raw_call,) = send_request_raw_.call_args_list
+        assert send_request_raw_call.kwargs == {"compression": "gzip", "dedupe": False}
+
+
+async def test_drop_oldest_events_with_slow_sender(*, dispatcher: Dispatcher):
+    with given:
+        class _VedroTelemetry(VedroTelemetry):
+            max_batch_size = 2
+            max_buffered_events = 4
+
+        send_request_ = Mock(side_effect=lambda *_: time.sleep(0.05) or (200, {}))
+        plugin = VedroTelemetryPlugin(_VedroTelemetry, send_request=send_request_)
+        plugin.subscribe(dispatcher)
+
+    with when:
+        buffered = []
+        for _ in range(20):
+            await dispatcher.fire(ArgParsedEvent(Namespace()))
+            buffered.append(len(plugin._events))
+        await dispatcher.fire(CleanupEvent(Report()))
+
+    with then:
+        assert max(buffered) <= _VedroTelemetry.max_buffered_events
+
+        events = [e for c in send_request_.call_args_list for e in c.args[-1]]
+        *arg_parsed_events, ended_event = events
+        assert ended_event["event_id"] == "EndedTelemetryEvent"
+        assert ended_event["dropped_events"] > 0
+        assert len(arg_parsed_events) + ended_event["dropped_events"] == 20
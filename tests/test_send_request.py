@@ -0,0 +1,265 @@
+import gzip
+import json
+from typing import Any, Dict, Iterator
+from unittest.mock import Mock, patch
+
+import pytest
+import zstandard
+from baby_steps import given, then, when
+
+from vedro_telemetry._send_request import (
+    _COMPRESSION_THRESHOLD,
+    _DEDUPE_CACHE,
+    TelemetryRequestError,
+    _compress_payload,
+    encode_json_array,
+    send_request,
+    send_request_raw,
+)
+
+URL = "http://localhost/v1/events"
+
+
+@pytest.fixture(autouse=True)
+def dedupe_cache() -> Iterator[Dict[bytes, Any]]:
+    with patch.dict(_DEDUPE_CACHE, clear=True):
+        yield _DEDUPE_CACHE
+
+
+def make_client(status: int = 200, content_type: str = "application/json",
+                text: str = "{}") -> Mock:
+    response = Mock(status_code=status, headers={"content-type": content_type}, text=text)
+    response.json.side_effect = lambda: json.loads(text)
+    return Mock(post=Mock(return_value=response))
+
+
+def get_post_headers(client: Mock) -> Dict[str, Any]:
+    (post_call,) = client.post.call_args_list
+    return post_call.kwargs["headers"]
+
+
+def test_compress_payload_disabled():
+    with given:
+        content = b"x" * (_COMPRESSION_THRESHOLD + 1)
+
+    with when:
+        res = _compress_payload(content, None)
+
+    with then:
+        assert res == (content, None)
+
+
+@pytest.mark.parametrize("compression", ["gzip", "zstd"])
+def test_compress_payload_below_threshold(compression: str):
+    with given:
+        content = b"x" * _COMPRESSION_THRESHOLD
+
+    with when:
+        res = _compress_payload(content, compression)
+
+    with then:
+        assert res == (content, None)
+
+
+def test_compress_payload_gzip():
+    with given:
+        content = b"x" * (_COMPRESSION_THRESHOLD + 1)
+
+    with when:
+        compressed, encoding = _compress_payload(content, "gzip")
+
+    with then:
+        assert encoding == "gzip"
+        assert gzip.decompress(compressed) == content
+
+
+def test_compress_payload_zstd():
+    with given:
+        content = b"x" * (_COMPRESSION_THRESHOLD + 1)
+
+    with when:
+        compressed, encoding = _compress_payload(content, "zstd")
+
+    with then:
+        assert encoding == "zstd"
+        assert zstandard.ZstdDecompressor().decompress(compressed) == content
+
+
+def test_compress_payload_unsupported():
+    with given:
+        content = b"x" * (_COMPRESSION_THRESHOLD + 1)
+
+    with when, pytest.raises(ValueError) as exc:
+        _compress_payload(content, "brotli")
+
+    with then:
+        assert str(exc.value) == "Unsupported compression: 'brotli'"
+
+
+def test_encode_json_array_big_int():
+    with given:
+        # Beyond the 64-bit range supported by orjson
+        items = [{"--seed": 2 ** 64}, {"--seed": -2 ** 64}]
+
+    with when:
+        body = encode_json_array(items)
+
+    with then:
+        assert json.loads(body) == items
+
+
+def test_send_request_big_int():
+    with given:
+        client = make_client()
+        payload = [{"args": {"--seed": 2 ** 64}}]
+
+    with when, patch("vedro_telemetry._send_request._get_client", return_value=client):
+        send_request(URL, 1.0, payload)
+
+    with then:
+        assert json.loads(client.post.call_args.kwargs["content"]) == payload
+
+
+def test_send_request_raw_uncompressed_by_default():
+    with given:
+        client = make_client()
+        body = b"[" + b"0," * _COMPRESSION_THRESHOLD + b"0]"
+
+    with when, patch("vedro_telemetry._send_request._get_client", return_value=client):
+        send_request_raw(URL, 1.0, body)
+
+    with then:
+        assert get_post_headers(client) == {"content-type": "application/json"}
+        assert client.post.call_args.kwargs["content"] == body
+
+
+def test_send_request_raw_compressed():
+    with given:
+        client = make_client()
+        body = b"[" + b"0," * _COMPRESSION_THRESHOLD + b"0]"
+
+    with when, patch("vedro_telemetry._send_request._get_client", return_value=client):
+        send_request_raw(URL, 1.0, body, compression="gzip")
+
+    with then:
+        assert get_post_headers(client) == {
+            "content-type": "application/json",
+            "content-encoding": "gzip",
+        }
+        assert gzip.decompress(client.post.call_args.kwargs["content"]) == body
+
+
+def test_send_request_raw_json_response():
+    with given:
+        client = make_client(text='{"ok": true}')
+
+    with when, patch("vedro_telemetry._send_request._get_client", return_value=client):
+        res = send_request_raw(URL, 1.0, b"[]")
+
+    with then:
+        assert res == (200, {"ok": True})
+
+
+def test_send_request_raw_text_response():
+    with given:
+        client = make_client(content_type="text/plain", text='{"ok": true}')
+
+    with when, patch("vedro_telemetry._send_request._get_client", return_value=client):
+        res = send_request_raw(URL, 1.0, b"[]")
+
+    with then:
+        assert res == (200, '{"ok": true}')
+        assert client.post.return_value.json.mock_calls == []
+
+
+def test_send_request_raw_malformed_json_response():
+    with given:
+        client = make_client(text="<html>")
+
+    with when, patch("vedro_telemetry._send_request._get_client", return_value=client):
+        res = send_request_raw(URL, 1.0, b"[]")
+
+    with then:
+        assert res == (200, "<html>")
+
+
+def test_send_request_raw_error_response():
+    with given:
+        client = make_client(status=500, content_type="text/plain", text="error")
+
+    with when, \
+         patch("vedro_telemetry._send_request._get_client", return_value=client), \
+         pytest.raises(TelemetryRequestError) as exc:
+        send_request_raw(URL, 1.0, b"[]")
+
+    with then:
+        assert str(exc.value) == f"Failed to send events to {URL!r}: 500 «error»"
+
+
+def test_send_request_raw_without_dedupe():
+    with given:
+        client = make_client()
+
+    with when, patch("vedro_telemetry._send_request._get_client", return_value=client):
+        send_request_raw(URL, 1.0, b"[]")
+        send_request_raw(URL, 1.0, b"[]")
+
+    with then:
+        assert client.post.call_count == 2
+
+
+def test_send_request_raw_with_dedupe():
+    with given:
+        client = make_client(text='{"ok": true}')
+
+    with when, patch("vedro_telemetry._send_request._get_client", return_value=client):
+        first = send_request_raw(URL, 1.0, b"[]", dedupe=True)
+        second = send_request_raw(URL, 1.0, b"[]", dedupe=True)
+
+    with then:
+        assert first == second == (200, {"ok": True})
+        assert client.post.call_count == 1
+
+
+def test_send_request_raw_dedupe_different_bodies():
+    with given:
+        client = make_client()
+
+    with when, patch("vedro_telemetry._send_request._get_client", return_value=client):
+        send_request_raw(URL, 1.0, b"[1]", dedupe=True)
+        send_request_raw(URL, 1.0, b"[2]", dedupe=True)
+
+    with then:
+        assert client.post.call_count == 2
+
+
+def test_send_request_raw_dedupe_error_not_cached(dedupe_cache: Dict[bytes, Any]):
+    with given:
+        client = make_client(status=500)
+
+    with when, patch("vedro_telemetry._send_request._get_client", return_value=client):
+        for _ in range(2):
+            with pytest.raises(TelemetryRequestError):
+                send_request_raw(URL, 1.0, b"[]", dedupe=True)
+
+    with then:
+        assert client.post.call_count == 2
+        assert dedupe_cache == {}
+
+
+def test_send_request_raw_dedupe_eviction(dedupe_cache: Dict[bytes, Any]):
+    with given:
+        client = make_client()
+
+    with when, \
+         patch("vedro_telemetry._send_request._get_client", return_value=client), \
+         patch("vedro_telemetry._send_request._DEDUPE_MAX_SIZE", 2):
+        for body in (b"[1]", b"[2]", b"[3]", b"[1]"):
+            send_request_raw(URL, 1.0, body, dedupe=True)
+
+    with then:
+        # [1] was evicted by [3] as the oldest entry, so it is sent again
+        assert [c.kwargs["content"] for c in client.post.call_args_list] == [
+            b"[1]", b"[2]", b"[3]", b"[1]",
+        ]
+        assert len(dedupe_cache) == 2
@@ -1,11 +1,72 @@
+import atexit
+import gzip
+import json
+from hashlib import blake2b
 from http import HTTPStatus
-from typing import Any, Callable, Tuple
+from json import JSONDecodeError
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
 
-from httpx import Client, RequestError
+from httpx import Client, Limits, RequestError, Response
 
-__all__ = ("send_request", "SendRequestFn",)
+
+def _encode_payload_stdlib(payload: Any) -> bytes:
+    """
+    Serialize the payload to JSON bytes using the standard library encoder.
+
+    :param payload: The JSON serializable data to encode.
+    :return: The encoded payload.
+    """
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+try:
+    import orjson
+
+    def _encode_payload(payload: Any) -> bytes:
+        """
+        Serialize the payload to JSON bytes using the `orjson` encoder.
+
+        orjson rejects some values that the standard library encodes, such as integers
+        beyond 64 bits (e.g., large command-line options), so such payloads fall back
+        to the standard library encoder.
+
+        :param payload: The JSON serializable data to encode.
+        :return: The encoded payload.
+        """
+        try:
+            return orjson.dumps(payload)
+        except orjson.JSONEncodeError:
+            return _encode_payload_stdlib(payload)
+
+except ImportError:  # pragma: no cover
+    _encode_payload = _encode_payload_stdlib
+
+# Payloads up to this size (in bytes) are sent uncompressed
+_COMPRESSION_THRESHOLD = 1024
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    _ZSTD = None
+else:
+    _ZSTD = zstandard.ZstdCompressor(level=3)
+_ZSTD_LOCK = Lock()
+
+__all__ = ("send_request", "send_request_raw", "encode_json_array", "SendRequestFn",
+           "SendRequestRawFn", "TelemetryRequestError",)
 
 SendRequestFn = Callable[[str, float, Any], Tuple[int, Any]]
+SendRequestRawFn = Callable[[str, float, bytes], Tuple[int, Any]]
+
+_HTTP_OK = HTTPStatus.OK.value
+
+_CLIENT: Optional[Client] = None
+_CLIENT_LOCK = Lock()
+
+# Maximum number of responses remembered for deduplication
+_DEDUPE_MAX_SIZE = 128
+_DEDUPE_CACHE: Dict[bytes, Tuple[int, Any]] = {}
 
 
 class TelemetryRequestError(Exception):
@@ -18,7 +79,138 @@ class TelemetryRequestError(Exception):
     pass
 
 
-def send_request(url: str, timeout: float, payload: Any) -> Tuple[int, Any]:
+def _get_client() -> Client:
+    """
+    Retrieve the shared HTTP client, creating it on first use.
+
+    The client keeps a small pool of keep-alive connections, so consecutive requests
+    to the same API reuse an already established connection instead of paying for
+    a new TCP (and TLS) handshake each time. The client is closed at interpreter exit.
+
+    :return: The shared `httpx.Client` instance.
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                limits = Limits(max_keepalive_connections=4, keepalive_expiry=60)
+                _CLIENT = Client(timeout=None, limits=limits)
+                atexit.register(_close_client)
+    return _CLIENT
+
+
+def _close_client() -> None:
+    """
+    Close the shared HTTP client if it has been created.
+    """
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is not None:
+            _CLIENT.close()
+            _CLIENT = None
+
+
+def _get_dedupe_key(url: str, body: bytes) -> bytes:
+    """
+    Compute the key identifying a batch sent to the given URL.
+
+    :param url: The target URL for the HTTP request.
+    :param body: The JSON encoded body of the request.
+    :return: A digest of the URL and the body.
+    """
+    digest = blake2b(url.encode(), digest_size=16)
+    digest.update(body)
+    return digest.digest()
+
+
+def _remember_response(key: bytes, result: Tuple[int, Any]) -> None:
+    """
+    Store the result of a successful request, evicting the oldest entry when full.
+
+    :param key: The key identifying the sent batch.
+    :param result: The status code and response body returned for the batch.
+    """
+    if len(_DEDUPE_CACHE) >= _DEDUPE_MAX_SIZE:
+        _DEDUPE_CACHE.pop(next(iter(_DEDUPE_CACHE)), None)
+    _DEDUPE_CACHE[key] = result
+
+
+def encode_json_array(items: Iterable[Any]) -> bytes:
+    """
+    Serialize the items to a JSON array one by one.
+
+    The items are consumed lazily, so when they are produced by a generator, only the
+    encoded body and a single item are held in memory at a time, instead of the whole
+    list of items alongside its serialized form.
+
+    :param items: The JSON serializable items to encode.
+    :return: The encoded JSON array.
+    """
+    body = bytearray(b"[")
+    for item in items:
+        if len(body) > 1:
+            body += b","
+        body += _encode_payload(item)
+    body += b"]"
+    return bytes(body)
+
+
+def _compress_payload(content: bytes,
+                      compression: Optional[str]) -> Tuple[bytes, Optional[str]]:
+    """
+    Compress the encoded payload if compression is enabled and the payload exceeds
+    the compression threshold.
+
+    Compression is opt-in, since the API has to decode the `Content-Encoding` of the
+    request. gzip uses the fastest compression level, since repetitive JSON compresses
+    well even at level 1.
+
+    :param content: The encoded payload.
+    :param compression: The compression algorithm, `"gzip"` or `"zstd"`, or `None` to
+                        send the payload uncompressed.
+    :return: A tuple containing the (possibly compressed) payload and the value for
+             the `Content-Encoding` header, or `None` if the payload is not compressed.
+    :raises ValueError: If the compression algorithm is not supported, or `"zstd"` is
+                        requested but the `zstandard` package is not installed.
+    """
+    if compression is None or len(content) <= _COMPRESSION_THRESHOLD:
+        return content, None
+
+    if compression == "gzip":
+        return gzip.compress(content, compresslevel=1), "gzip"
+
+    if compression == "zstd":
+        if _ZSTD is None:  # pragma: no cover
+            raise ValueError("zstd compression requires the 'zstandard' package")
+        # ZstdCompressor instances must not be used from multiple threads at once
+        with _ZSTD_LOCK:
+            return _ZSTD.compress(content), "zstd"
+
+    raise ValueError(f"Unsupported compression: {compression!r}")
+
+
+def _parse_response_body(response: Response) -> Any:
+    """
+    Parse the response body according to its content type.
+
+    The body is decoded as JSON only if the server declares a JSON content type;
+    otherwise, the raw text is returned without attempting to parse it.
+
+    :param response: The HTTP response to parse.
+    :return: The parsed JSON body, or the raw text if the body is not JSON.
+    """
+    content_type = response.headers.get("content-type", "")
+    if "json" not in content_type:
+        return response.text
+    try:
+        return response.json()
+    except (ValueError, JSONDecodeError):
+        # The server declared JSON but sent a malformed (or non-UTF-8) body
+        return response.text
+
+
+def send_request(url: str, timeout: float, payload: Any, *,
+                 compression: Optional[str] = None, dedupe: bool = False) -> Tuple[int, Any]:
     """
     Send an HTTP POST request with a JSON payload to the specified URL.
 
@@ -29,6 +221,10 @@ def send_request(url: str, timeout: float, payload: Any) -> Tuple[int, Any]:
     :param url: The target URL for the HTTP request.
     :param timeout: The maximum time to wait for the request to complete.
     :param payload: The JSON serializable data to send in the body of the request.
+    :param compression: The compression algorithm for large payloads, `"gzip"` or
+                        `"zstd"`. By default, the payload is sent uncompressed.
+    :param dedupe: If True, the response to an identical payload previously sent to the
+                   same URL is returned without sending the request again.
 
     :return: A tuple containing the HTTP status code and the response body. The
              response body is parsed as JSON if possible; otherwise, the raw
@@ -37,18 +233,60 @@ def send_request(url: str, timeout: float, payload: Any) -> Tuple[int, Any]:
     :raises TelemetryRequestError: If the request fails due to a connection error
                                    or a non-OK status is received.
     """
-    with Client() as client:
-        try:
-            response = client.post(url, json=payload, timeout=timeout)
-        except RequestError as e:
-            raise TelemetryRequestError(f"Failed to send events to {url!r}: «{e!r}»") from None
+    return send_request_raw(url, timeout, _encode_payload(payload),
+                            compression=compression, dedupe=dedupe)
 
-        status = response.status_code
-        try:
-            body = response.json()
-        except:  # noqa: E722
-            body = response.text
 
-    if status != HTTPStatus.OK:
-        raise TelemetryRequestError(f"Failed to send events to {url!r}: {status} «{body}»")
-    return status, body
+def send_request_raw(url: str, timeout: float, body: bytes, *,
+                     compression: Optional[str] = None, dedupe: bool = False) -> Tuple[int, Any]:
+    """
+    Send an HTTP POST request with an already encoded JSON body to the specified URL.
+
+    This function behaves like `send_request`, but skips payload serialization. It is
+    intended for callers that encode events incrementally as they occur, so that the
+    events do not have to be kept in memory alongside their serialized form.
+
+    :param url: The target URL for the HTTP request.
+    :param timeout: The maximum time to wait for the request to complete.
+    :param body: The JSON encoded body of the request.
+    :param compression: The compression algorithm for large bodies, `"gzip"` or
+                        `"zstd"`. By default, the body is sent uncompressed.
+    :param dedupe: If True, the response to an identical body previously sent to the
+                   same URL is returned without sending the request again. Only
+                   successful responses are remembered.
+
+    :return: A tuple containing the HTTP status code and the response body. The
+             response body is parsed as JSON if possible; otherwise, the raw
+             text response is returned.
+
+    :raises TelemetryRequestError: If the request fails due to a connection error
+                                   or a non-OK status is received.
+    """
+    if dedupe:
+        dedupe_key = _get_dedupe_key(url, body)
+        if (cached := _DEDUPE_CACHE.get(dedupe_key)) is not None:
+            return cached
+
+    content, content_encoding = _compress_payload(body, compression)
+    headers = {"content-type": "application/json"}
+    if content_encoding is not None:
+        headers["content-encoding"] = content_encoding
+
+    client = _get_client()
+    try:
+        response = client.post(url, content=content, headers=headers, timeout=timeout)
+    except RequestError as e:
+        raise TelemetryRequestError(f"Failed to send events to {url!r}: «{e!r}»") from None
+
+    status = response.status_code
+    response_body = _parse_response_body(response)
+
+    if status != _HTTP_OK:
+        raise TelemetryRequestError(
+            f"Failed to send events to {url!r}: {status} «{response_body}»"
+        )
+
+    if dedupe:
+        # Only successful responses are remembered, failed batches are sent again
+        _remember_response(dedupe_key, (status, response_body))
+    return status, response_body
@@ -1,31 +1,35 @@
+import os
+from functools import lru_cache
 from importlib.metadata import PackageNotFoundError, metadata
 from pathlib import Path
-from time import time
+from time import time_ns
 from typing import Optional, Union
 
 __all__ = ("now", "get_project_name", "get_package_version",)
 
 
-def _get_project_name(path: Path) -> Union[str, None]:
+def _get_project_name(path: Union[str, Path]) -> Union[str, None]:
     """
-    Recursively retrieve the name of the project by looking for a `.git` directory.
+    Retrieve the name of the project by looking for a `.git` directory.
 
-    This function searches up the directory tree from the specified path for a `.git`
-    folder to determine if the path is part of a Git project. If a `.git` directory
-    is found, the function returns the name of the directory, which is assumed to be
-    the project name.
+    This function walks up the directory tree from the specified path looking for a
+    `.git` folder to determine if the path is part of a Git project. If a `.git`
+    directory is found, the function returns the name of the directory, which is
+    assumed to be the project name.
 
     :param path: The starting path to search for a `.git` folder.
     :return: The name of the project directory if found, otherwise `None`.
     """
-    maybe_git = path / ".git"
-    if maybe_git.exists() and maybe_git.is_dir():
-        return path.name
+    current = os.fspath(path)
+    while True:
+        # A single stat() call per level; errors are treated as "not a directory"
+        if os.path.isdir(os.path.join(current, ".git")):
+            return os.path.basename(current)
 
-    if path == Path(path.root):
-        return None
-
-    return _get_project_name(path.parent)
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
 
 
 def get_project_name(path: Optional[Path] = None, *, default: str = "") -> str:
@@ -43,33 +47,49 @@ def get_project_name(path: Optional[Path] = None, *, default: str = "") -> str:
     :return: The project name if found, otherwise the specified default value.
     """
     if path is None:
-        path = Path()
+        abs_path = os.getcwd()
+    elif path.is_absolute():
+        abs_path = os.fspath(path)
+    else:
+        abs_path = os.path.abspath(path)
 
-    if not path.is_absolute():
-        path = path.absolute()
-
-    if project_name := _get_project_name(path):
+    if project_name := _get_project_name(abs_path):
         return project_name
     return default
 
 
+@lru_cache(maxsize=None)
+def _get_package_version(name: str) -> Optional[str]:
+    """
+    Retrieve the version of the installed package with the specified name, if any.
+
+    Only the metadata of the requested distribution is read, once per process.
+
+    :param name: The name of the package to retrieve the version for.
+    :return: The version string of the package, or `None` if it is not found.
+    """
+    try:
+        package_metadata = metadata(name)
+    except PackageNotFoundError:
+        return None
+    return str(package_metadata["Version"]) if ("Version" in package_metadata) else None
+
+
 def get_package_version(name: str, *, default: str = "0.0.0") -> str:
     """
     Retrieve the version of the installed package with the specified name.
 
     This function queries the installed package metadata to get the version number.
-    If the package is not found, a default version string is returned.
+    If the package is not found, a default version string is returned. The metadata
+    of each package is read from disk only once per process.
 
     :param name: The name of the package to retrieve the version for.
     :param default: The default version string to return if the package is not found.
                     Default is "0.0.0".
     :return: The version string of the package if found, otherwise the specified default value.
     """
-    try:
-        version = metadata(name)
-    except PackageNotFoundError:
-        return default
-    return str(version["Version"]) if ("Version" in version) else default
+    version = _get_package_version(name)
+    return default if version is None else version
 
 
 def now() -> int:
@@ -81,4 +101,4 @@ def now() -> int:
 
     :return: The current time in milliseconds.
     """
-    return round(time() * 1000)
+    return time_ns() // 1_000_000
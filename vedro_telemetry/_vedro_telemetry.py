@@ -3,10 +3,27 @@ import os
 import sys
 from argparse import ArgumentParser
 from base64 import b64decode
+from collections import deque
+from functools import partial
 from pathlib import Path
+from threading import Condition, Event, Lock, Thread
+from time import monotonic
 from traceback import format_tb
 from types import TracebackType
-from typing import Any, List, Type, Union, final
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Sized,
+    Tuple,
+    Type,
+    Union,
+    final,
+)
 from uuid import uuid4
 
 from vedro.core import ConfigType, Dispatcher, ExcInfo, Plugin, PluginConfig, VirtualScenario
@@ -19,7 +36,13 @@ from vedro.events import (
     StartupEvent,
 )
 
-from ._send_request import SendRequestFn, send_request
+from ._send_request import (
+    SendRequestFn,
+    SendRequestRawFn,
+    TelemetryRequestError,
+    encode_json_array,
+)
+from ._send_request import send_request_raw as _send_request_raw
 from ._utils import get_package_version, get_project_name, now
 from .events import (
     ArgParsedTelemetryEvent,
@@ -36,6 +59,17 @@ from .events import (
 
 __all__ = ("VedroTelemetry", "VedroTelemetryPlugin",)
 
+# ASCII record separator, used to join traceback frames for a single replace() call
+_FRAME_SEPARATOR = "\x1e"
+
+# httpx applies the request timeout to each of the connect, write, read and pool phases,
+# so a single request may take up to this many timeouts before it fails
+_TIMEOUT_PHASES = 4
+
+# The script path is resolved once, since it does not change during the process lifetime
+_ARGV0 = sys.argv[0] if sys.argv else ""
+_ARGV0_ABS = os.path.abspath(_ARGV0)
+
 
 @final
 class VedroTelemetryPlugin(Plugin):
@@ -47,30 +81,69 @@ class VedroTelemetryPlugin(Plugin):
     events are sent to a specified API endpoint at the end of the test session.
 
     Telemetry events are generated and buffered during the test run, and then they are
-    sent to the API either when the session ends or when explicitly triggered.
+    sent to the API either when the session ends or when explicitly triggered. Long runs
+    are flushed in the background whenever the buffer reaches `max_batch_size` events
+    and every `flush_interval_ms` milliseconds.
     """
 
     _inited_at = now()
 
     def __init__(self, config: Type["VedroTelemetry"], *,
-                 send_request: SendRequestFn = send_request) -> None:
+                 send_request: Optional[SendRequestFn] = None,
+                 send_request_raw: Optional[SendRequestRawFn] = None) -> None:
         """
         Initialize the VedroTelemetryPlugin with the provided configuration.
 
         :param config: The configuration for the plugin, including the API URL, timeout, etc.
-        :param send_request: A function used to send requests to the API (defaults to the
-                             built-in `send_request` function).
+        :param send_request: A function used to send requests to the API, which receives
+                             the events as a list of dictionaries. If provided, it takes
+                             precedence over `send_request_raw`.
+        :param send_request_raw: A function used to send requests to the API, which
+                                 receives the events as an encoded JSON body (defaults to
+                                 the built-in `send_request_raw` function, configured by
+                                 the `compression` and `dedupe` options).
+        :raises ValueError: If `max_batch_size`, `flush_interval_ms` or
+                            `max_buffered_events` is not positive.
         """
         super().__init__(config)
+        if config.max_batch_size <= 0:
+            raise ValueError(f"max_batch_size must be positive, got {config.max_batch_size!r}")
+        if config.flush_interval_ms <= 0:
+            raise ValueError(
+                f"flush_interval_ms must be positive, got {config.flush_interval_ms!r}"
+            )
+        if config.max_buffered_events <= 0:
+            raise ValueError(
+                f"max_buffered_events must be positive, got {config.max_buffered_events!r}"
+            )
         self._api_url = config.api_url.strip("/")
         self._timeout = config.timeout
         self._raise_exception = config.raise_exception_on_failure
+        self._max_batch_size = config.max_batch_size
+        self._max_buffered_events = config.max_buffered_events
+        self._flush_interval = config.flush_interval_ms / 1000
         self._send_request = send_request
-        self._session_id = uuid4()
+        self._send_request_raw = send_request_raw or partial(
+            _send_request_raw, compression=config.compression, dedupe=config.dedupe
+        )
+        # Stringified (and interned) once, so that all events share the same string object
+        self._session_id = sys.intern(str(uuid4()))
         self._project_id = config.project_id or get_project_name(default="unknown")
-        self._events: List[TelemetryEvent] = []
+        # All events that have not been handed to the flush worker yet
+        self._events: Deque[TelemetryEvent] = deque()
+        self._dropped_events = 0
+        self._events_lock = Lock()
+        self._events_changed = Condition(self._events_lock)
+        self._flush_worker: Union[Thread, None] = None
+        self._flush_stop = Event()
+        self._flush_error: Union[BaseException, None] = None
         self._arg_parser: Union[ArgumentParser, None] = None
+        self._arg_actions: Union[List[Tuple[str, str, Any]], None] = None
         self._global_config: Union[ConfigType, None] = None
+        self._project_dir: Union[str, None] = None
+        self._scenario_ids: Dict[str, str] = {}
+        self._atexit_registered = False
+        self._cleaned_up = False
 
     def subscribe(self, dispatcher: Dispatcher) -> None:
         """
@@ -99,24 +172,26 @@ class VedroTelemetryPlugin(Plugin):
         :param event: The `ConfigLoadedEvent` from which to extract configuration details.
         """
         self._global_config = event.config
+        self._project_dir = str(self._get_project_dir())
 
         plugins: List[PluginInfo] = []
         for _, section in self._global_config.Plugins.items():
-            name, module = section.plugin.__name__, section.plugin.__module__
-            package = module.split(".")[0]
-            if module.startswith("vedro.plugins") and section.enabled:
+            plugin, enabled = section.plugin, section.enabled
+            module = plugin.__module__
+            if module.startswith("vedro.plugins") and enabled:
                 continue
+            package = module.partition(".")[0]
             plugins.append({
-                "name": name,
+                "name": plugin.__name__,
                 "module": module,
-                "enabled": section.enabled,
+                "enabled": enabled,
                 "version": get_package_version(package),
             })
         environment: EnvironmentInfo = {
             "python_version": sys.version,
             "vedro_version": get_package_version("vedro"),
         }
-        self._events.append(
+        self._add_event(
             StartedTelemetryEvent(
                 session_id=self._session_id,
                 project_id=self._project_id,
@@ -125,7 +200,11 @@ class VedroTelemetryPlugin(Plugin):
                 plugins=plugins,
             )
         )
-        atexit.register(self._send_events)
+        with self._events_lock:
+            self._start_flush_worker()
+        if not self._atexit_registered:
+            atexit.register(self._flush_at_exit)
+            self._atexit_registered = True
 
     def on_arg_parse(self, event: ArgParseEvent) -> None:
         """
@@ -137,9 +216,11 @@ class VedroTelemetryPlugin(Plugin):
         :param event: The `ArgParseEvent` containing the argument parser information.
         """
         self._arg_parser = event.arg_parser
+        self._arg_actions = None
         path, *args = sys.argv
-        prog = self._cleanup_arg(os.path.abspath(path))
-        self._events.append(
+        abs_path = _ARGV0_ABS if path == _ARGV0 else os.path.abspath(path)
+        prog = self._cleanup_arg(abs_path)
+        self._add_event(
             ArgParseTelemetryEvent(self._session_id, [prog] + args)
         )
 
@@ -152,19 +233,37 @@ class VedroTelemetryPlugin(Plugin):
         :param event: The `ArgParsedEvent` containing the parsed argument values.
         """
         args = {}
-        actions = getattr(self._arg_parser, "_actions", [])
-        for action in actions:
-            if action.dest not in event.args:
+        values = vars(event.args)
+        for dest, arg, default in self._get_arg_actions():
+            if dest not in values:
                 continue
-            arg = max(action.option_strings, key=len) if action.option_strings else action.dest
-            val = getattr(event.args, action.dest)
-            if val != action.default:
+            val = values[dest]
+            if val != default:
                 args[arg] = self._cleanup_arg(val)
 
-        self._events.append(
+        self._add_event(
             ArgParsedTelemetryEvent(self._session_id, args)
         )
 
+    def _get_arg_actions(self) -> List[Tuple[str, str, Any]]:
+        """
+        Retrieve the destination, argument name and default value of each parser action.
+
+        The list is built once per argument parser and keeps the parser order. Several
+        actions may share a destination (e.g., `--verbose` and `--quiet`), so each of
+        them is kept. The longest option string is used as the argument name; positional
+        arguments are named after their destination.
+
+        :return: A list of (destination, argument name, default) tuples.
+        """
+        if self._arg_actions is None:
+            self._arg_actions = []
+            for action in getattr(self._arg_parser, "_actions", []):
+                opts = action.option_strings
+                arg = max(opts, key=len) if opts else action.dest
+                self._arg_actions.append((action.dest, arg, action.default))
+        return self._arg_actions
+
     def on_startup(self, event: StartupEvent) -> None:
         """
         Handle the StartupEvent to capture information about discovered and scheduled scenarios.
@@ -175,23 +274,46 @@ class VedroTelemetryPlugin(Plugin):
         :param event: The `StartupEvent` containing information about discovered and
                       scheduled scenarios.
         """
-        discovered = len(list(event.scheduler.discovered))
-        scheduled = len(list(event.scheduler.scheduled))
-        self._events.append(
+        discovered = self._count(event.scheduler.discovered)
+        scheduled = self._count(event.scheduler.scheduled)
+        self._add_event(
             StartupTelemetryEvent(self._session_id, discovered, scheduled)
         )
 
+    def _count(self, items: Iterable[Any]) -> int:
+        """
+        Count the items without materializing them into a list.
+
+        :param items: A sized collection or an iterator of items.
+        :return: The number of items.
+        """
+        if isinstance(items, Sized):
+            return len(items)
+        return sum(1 for _ in items)
+
     def _get_scenario_id(self, scenario: VirtualScenario) -> str:
         """
         Extract the unique scenario ID.
 
+        The decoded ID is cached, since the same scenario can fail more than once
+        (e.g., when it is rerun).
+
         :param scenario: The `VirtualScenario` object containing the unique ID.
         :return: The decoded unique ID of the scenario.
         """
+        unique_id = scenario.unique_id
+        if (scenario_id := self._scenario_ids.get(unique_id)) is not None:
+            return scenario_id
+
         # Ensure compatibility with Vedro v1.10 by checking the format of the unique_id
-        if "::" not in scenario.unique_id:
-            return b64decode(scenario.unique_id + "===").decode()
-        return scenario.unique_id
+        if "::" not in unique_id:
+            padding = "=" * (-len(unique_id) % 4)
+            scenario_id = b64decode(unique_id + padding).decode()
+        else:
+            scenario_id = unique_id
+        # Keyed by unique_id rather than id(scenario), which may be reused after GC
+        self._scenario_ids[unique_id] = scenario_id
+        return scenario_id
 
     def on_scenario_failed(self, event: ScenarioFailedEvent) -> None:
         """
@@ -205,21 +327,29 @@ class VedroTelemetryPlugin(Plugin):
         scenario_result = event.scenario_result
         scenario_id = self._get_scenario_id(event.scenario_result.scenario)
 
+        # The timestamp is taken once for all failed steps of the scenario
+        created_at = now()
+        events: List[TelemetryEvent] = []
         for step_result in scenario_result.step_results:
             exc_info = step_result.exc_info
             if exc_info is None:
                 continue
             exception = self._format_exception(exc_info)
-            self._events.append(
-                ExcRaisedTelemetryEvent(self._session_id, scenario_id, exception)
+            events.append(
+                ExcRaisedTelemetryEvent._fast_new(self._session_id, created_at,
+                                                  scenario_id, exception)
             )
+        if events:
+            self._add_events(events)
 
     def on_cleanup(self, event: CleanupEvent) -> None:
         """
         Handle the CleanupEvent to finalize the telemetry session and send all collected events.
 
-        This method generates an `EndedTelemetryEvent` and sends the buffered telemetry events
-        to the API endpoint.
+        This method generates an `EndedTelemetryEvent` and sends the remaining buffered
+        telemetry events to the API endpoint in the background. The wait is bounded by
+        the number of pending batches times the time a single request may take when it
+        runs into the configured timeout (see `_flush_all`).
 
         :param event: The `CleanupEvent` signaling the end of the test session.
         """
@@ -229,38 +359,201 @@ class VedroTelemetryPlugin(Plugin):
         if getattr(report, "interrupted", None):
             interrupted = self._format_exception(report.interrupted)  # type: ignore
 
-        self._events.append(
-            EndedTelemetryEvent(
-                session_id=self._session_id,
-                total=report.total,
-                passed=report.passed,
-                failed=report.failed,
-                skipped=report.skipped,
-                interrupted=interrupted,
-            )
+        ended_event = EndedTelemetryEvent(
+            session_id=self._session_id,
+            total=report.total,
+            passed=report.passed,
+            failed=report.failed,
+            skipped=report.skipped,
+            interrupted=interrupted,
+            dropped_events=self._dropped_events,
         )
-        try:
-            self._send_events()
-        finally:
-            atexit.unregister(self._send_events)
+        # Set before flushing, so a failed flush is not retried at exit
+        self._cleaned_up = True
+        # The final event bypasses the buffer, so it can't evict an event itself
+        self._flush_all(ended_event)
+
+    def _add_event(self, event: TelemetryEvent) -> None:
+        """
+        Buffer a telemetry event, waking up the flush worker when a batch is full.
 
-    def _send_events(self) -> None:
+        If the buffer already holds `max_buffered_events` events, the oldest one is
+        dropped and counted.
+
+        :param event: The telemetry event to buffer.
+        """
+        with self._events_lock:
+            if len(self._events) >= self._max_buffered_events:
+                self._events.popleft()
+                self._dropped_events += 1
+            self._events.append(event)
+            self._notify_if_full()
+
+    def _add_events(self, events: List[TelemetryEvent]) -> None:
+        """
+        Buffer several telemetry events at once, acquiring the events lock only once.
+
+        :param events: The telemetry events to buffer.
+        """
+        with self._events_lock:
+            self._events.extend(events)
+            overflow = len(self._events) - self._max_buffered_events
+            for _ in range(overflow):
+                self._events.popleft()
+            if overflow > 0:
+                self._dropped_events += overflow
+            self._notify_if_full()
+
+    def _notify_if_full(self) -> None:
         """
-        Send the buffered telemetry events to the API endpoint.
+        Wake up the flush worker if the buffer holds at least a full batch.
 
-        This method sends the collected telemetry data as a payload to the configured API URL.
-        In case of a failure, it either raises an exception or logs the error to stderr.
+        The caller must hold the events lock.
         """
-        payload = [e.to_dict() for e in self._events]
+        if len(self._events) >= self._max_batch_size:
+            self._start_flush_worker()
+            self._events_changed.notify()
+
+    def _take_batch(self) -> List[TelemetryEvent]:
+        """
+        Take up to `max_batch_size` of the oldest buffered events.
+
+        The caller must hold the events lock.
+
+        :return: The taken telemetry events.
+        """
+        size = min(len(self._events), self._max_batch_size)
+        return [self._events.popleft() for _ in range(size)]
+
+    def _start_flush_worker(self) -> Thread:
+        """
+        Start the background flush worker if it is not running yet.
+
+        The caller must hold the events lock.
+
+        :return: The running flush worker thread.
+        """
+        if self._flush_worker is None:
+            self._flush_stop = Event()
+            self._flush_worker = Thread(target=self._run_flush_worker, args=(self._flush_stop,),
+                                        name="vedro-telemetry-flush", daemon=True)
+            self._flush_worker.start()
+        return self._flush_worker
+
+    def _run_flush_worker(self, stop: Event) -> None:
+        """
+        Send batches of telemetry events in the background.
+
+        The worker sends a batch as soon as the buffer holds `max_batch_size` events, and
+        independently flushes the buffer every `flush_interval_ms` milliseconds. Batches
+        are taken from the buffer only when they are about to be sent, so events waiting
+        for a slow API stay within `max_buffered_events`. Once `stop` is set, the worker
+        sends the remaining events and exits.
+
+        :param stop: The event signaling the worker to send the remaining events and exit.
+        """
+        next_flush_at = monotonic() + self._flush_interval
+        while True:
+            with self._events_lock:
+                while (not stop.is_set() and len(self._events) < self._max_batch_size
+                       and (remaining := next_flush_at - monotonic()) > 0):
+                    self._events_changed.wait(remaining)
+                if monotonic() >= next_flush_at:
+                    next_flush_at = monotonic() + self._flush_interval
+                events = self._take_batch()
+            if events:
+                self._send_events_in_background(events)
+            elif stop.is_set():
+                return
+
+    def _send_events_in_background(self, events: Sequence[TelemetryEvent]) -> None:
+        """
+        Send a batch of telemetry events from the flush worker.
+
+        After the first failure, the API is considered unavailable for the rest of the
+        session: the remaining batches are dropped instead of each of them running into
+        the timeout, and the error is reported once by `_flush_all`.
+
+        :param events: The telemetry events to send.
+        """
+        if self._flush_error is not None:
+            return
         try:
-            self._send_request(f"{self._api_url}/v1/events", self._timeout, payload)
+            self._send_batch(events)
         except BaseException as e:
-            if self._raise_exception:
-                raise
-            else:
-                # Log the error to stderr instead of raising an exception
-                print(f"[Error] {e!r}", file=sys.stderr)
-        self._events = []
+            self._flush_error = e
+
+    def _flush_at_exit(self) -> None:
+        """
+        Send the remaining events at interpreter exit if the session was not cleaned up.
+
+        This method is registered with `atexit` once and does nothing if `on_cleanup`
+        has already flushed the events, so it never has to be unregistered.
+        """
+        if not self._cleaned_up:
+            self._flush_all()
+
+    def _flush_all(self, *final_events: TelemetryEvent) -> None:
+        """
+        Send the remaining events in the background and wait for all flushes to complete.
+
+        The flush worker is signaled to stop, so it sends the remaining events after any
+        pending batches and exits. The wait is bounded by the time the pending requests
+        may take when each of them runs into the request timeout, so a slow API does not
+        fail the run while it still accepts the data, and a hung transport does not hold
+        up the end of the test run indefinitely.
+
+        :param final_events: Events to send after the buffered ones, such as the
+                             `EndedTelemetryEvent`.
+        :raises BaseException: The error that stopped sending events, or a
+                               `TelemetryRequestError` if sending did not finish in time,
+                               if exceptions are enabled. Otherwise, the error is logged
+                               to stderr.
+        """
+        with self._events_lock:
+            # The final events are not subject to `max_buffered_events`
+            self._events.extend(final_events)
+            # Plus one batch that may already be in flight
+            pending_batches = -(-len(self._events) // self._max_batch_size) + 1
+            worker = self._start_flush_worker()
+            self._flush_worker = None
+            self._flush_stop.set()
+            self._events_changed.notify()
+        deadline = round(pending_batches * _TIMEOUT_PHASES * self._timeout, 3)
+        worker.join(timeout=deadline)
+
+        error = self._flush_error
+        if error is None and worker.is_alive():
+            error = TelemetryRequestError(
+                f"Timed out sending events to {self._api_url!r} after {deadline}s"
+            )
+        if error is None:
+            return
+
+        if self._raise_exception:
+            raise error
+        else:
+            # Log the error to stderr instead of raising an exception
+            print(f"[Error] {error!r}", file=sys.stderr)
+
+    def _send_batch(self, events: Sequence[TelemetryEvent]) -> None:
+        """
+        Send a batch of telemetry events to the API endpoint.
+
+        This method sends the telemetry data as a payload to the configured API URL.
+        Errors are propagated to the caller.
+
+        :param events: The telemetry events to send.
+        """
+        url = f"{self._api_url}/v1/events"
+        if self._send_request is not None:
+            payload = [e.to_dict() for e in events]
+            self._send_request(url, self._timeout, payload)
+        else:
+            # Each event is serialized right after conversion, instead of building
+            # the dictionaries of all events first
+            body = encode_json_array(e.to_dict() for e in events)
+            self._send_request_raw(url, self._timeout, body)
 
     def _format_exception(self, exc_info: ExcInfo) -> ExceptionInfo:
         """
@@ -284,12 +577,20 @@ class VedroTelemetryPlugin(Plugin):
         Format the traceback for telemetry reporting.
 
         This method extracts and cleans up the traceback information to ensure it is ready
-        for inclusion in telemetry events.
+        for inclusion in telemetry events. The frames are joined so that the project
+        directory is replaced in a single pass, and then split back.
 
         :param tb: The traceback object to format.
         :return: A list of formatted traceback strings.
         """
-        return [self._cleanup_arg(x) for x in format_tb(tb, limit=100)]
+        frames = format_tb(tb, limit=100)
+        cwd = self._get_project_dir_str()
+
+        blob = _FRAME_SEPARATOR.join(frames)
+        if blob.count(_FRAME_SEPARATOR) != len(frames) - 1:
+            # No frames at all, or a frame contains the separator and cannot be split back
+            return [self._cleanup_arg(x, cwd) for x in frames]
+        return blob.replace(cwd, ".").split(_FRAME_SEPARATOR)
 
     def _get_project_dir(self) -> Path:
         """
@@ -300,7 +601,20 @@ class VedroTelemetryPlugin(Plugin):
         project_dir = getattr(self._global_config, "project_dir", Path.cwd())
         return project_dir.resolve()
 
-    def _cleanup_arg(self, arg: Any) -> Any:
+    def _get_project_dir_str(self) -> str:
+        """
+        Retrieve the project directory as a string, resolving it only once.
+
+        The value is computed when the configuration is loaded; if it is requested
+        before that, the current working directory is resolved and cached instead.
+
+        :return: The resolved project directory as a string.
+        """
+        if self._project_dir is None:
+            self._project_dir = str(self._get_project_dir())
+        return self._project_dir
+
+    def _cleanup_arg(self, arg: Any, cwd: Union[str, None] = None) -> Any:
         """
         Clean up command-line arguments or other data before reporting.
 
@@ -308,17 +622,27 @@ class VedroTelemetryPlugin(Plugin):
         to avoid reporting sensitive information.
 
         :param arg: The argument or data to clean up.
+        :param cwd: The project directory to replace. If not provided, it is retrieved
+                    once and passed down to nested values.
         :return: The cleaned-up argument or data.
         """
+        if cwd is None:
+            cwd = self._get_project_dir_str()
+
+        # Fast path for the most common leaf type (argv items, traceback lines).
+        # Most values don't contain the project directory, so check before replacing
+        if type(arg) is str:
+            return arg.replace(cwd, ".") if cwd in arg else arg
+
         if isinstance(arg, dict):
-            return {k: self._cleanup_arg(v) for k, v in arg.items()}
+            return {k: self._cleanup_arg(v, cwd) for k, v in arg.items()}
         elif isinstance(arg, list):
-            return [self._cleanup_arg(v) for v in arg]
+            return [self._cleanup_arg(v, cwd) for v in arg]
         elif isinstance(arg, (type(None), bool, int, float)):
             return arg
         else:
-            cwd = str(self._get_project_dir())
-            return str(arg).replace(cwd, ".")
+            value = str(arg)
+            return value.replace(cwd, ".") if cwd in value else value
 
 
 class VedroTelemetry(PluginConfig):
@@ -341,3 +665,20 @@ class VedroTelemetry(PluginConfig):
 
     # If True, raise an exception if telemetry data fails to send
     raise_exception_on_failure: bool = True
+
+    # Number of buffered events that triggers a background flush (must be positive)
+    max_batch_size: int = 1024
+
+    # Interval (in milliseconds) between periodic background flushes (must be positive)
+    flush_interval_ms: int = 30_000
+
+    # Maximum number of events kept in the buffer (must be positive);
+    # the oldest ones are dropped beyond it
+    max_buffered_events: int = 4096
+
+    # Compression for large request bodies: None, "gzip" or "zstd" (requires `zstandard`).
+    # The API must decode the request Content-Encoding, so it is disabled by default
+    compression: Union[str, None] = None
+
+    # If True, identical batches are answered from memory instead of being sent again
+    dedupe: bool = False
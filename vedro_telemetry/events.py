@@ -1,6 +1,4 @@
-from abc import ABC, abstractmethod
-from typing import Any, Dict, List, TypedDict, Union
-from uuid import UUID
+from typing import Any, Callable, ClassVar, Dict, List, Tuple, TypedDict, Union
 
 from ._utils import now
 
@@ -57,38 +55,71 @@ class EnvironmentInfo(TypedDict):
     vedro_version: str
 
 
-class TelemetryEvent(ABC):
+class TelemetryEvent:
     """
-    Abstract base class for telemetry events.
+    Base class for telemetry events.
 
     This class defines the interface for telemetry events, including methods
     for converting events to dictionary format and representing them as strings.
-    It also stores the time of event creation.
+    It also stores the time of event creation. Subclasses must override `to_dict`,
+    `to_tuple` and `__repr__`; it is a plain class rather than an `ABC` to keep
+    event construction free of metaclass overhead.
     """
 
-    def __init__(self) -> None:
+    __slots__ = ("_created_at",)
+
+    # The event ID reported in `to_dict` and the name used in `__repr__`, both set to
+    # the class name for every subclass
+    _event_id: ClassVar[str]
+    _cls_name: ClassVar[str]
+
+    # The names of the values returned by `to_tuple`, in the same order
+    fields: ClassVar[Tuple[str, ...]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Precompute the event ID and the name of the subclass, so they are not looked up
+        or formatted on every call.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._event_id = cls.__name__
+        cls._cls_name = cls.__name__
+
+    def __init__(self, _now: Callable[[], int] = now) -> None:
         """
         Initialize the telemetry event and record its creation timestamp.
+
+        :param _now: The clock function, bound as a default argument so that it is
+                     looked up as a local instead of a global on every event.
         """
-        self._created_at = now()
+        self._created_at = _now()
 
-    @abstractmethod
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert the telemetry event into a dictionary format.
 
         :return: A dictionary representing the telemetry event.
         """
-        pass
+        raise NotImplementedError()
+
+    def to_tuple(self) -> Tuple[Any, ...]:
+        """
+        Convert the telemetry event into a tuple of values in the order of `fields`.
+
+        This is a more compact alternative to `to_dict`, since the field names are
+        not repeated for every event.
+
+        :return: A tuple representing the telemetry event.
+        """
+        raise NotImplementedError()
 
-    @abstractmethod
     def __repr__(self) -> str:
         """
         Return a string representation of the telemetry event.
 
         :return: A string that describes the telemetry event.
         """
-        pass
+        raise NotImplementedError()
 
 
 class StartedTelemetryEvent(TelemetryEvent):
@@ -100,8 +131,12 @@ class StartedTelemetryEvent(TelemetryEvent):
     and loaded plugins.
     """
 
+    __slots__ = ("_session_id", "_project_id", "_inited_at", "_environment", "_plugins",)
+    fields = ("event_id", "session_id", "created_at", "project_id", "inited_at", "environment",
+              "plugins",)
+
     def __init__(self,
-                 session_id: UUID,
+                 session_id: str,
                  project_id: str, inited_at: int,
                  environment: EnvironmentInfo,
                  plugins: List[PluginInfo]) -> None:
@@ -116,11 +151,35 @@ class StartedTelemetryEvent(TelemetryEvent):
         :param plugins: A list of plugins loaded during the session.
         """
         super().__init__()
-        self._session_id = str(session_id)
+        self._session_id = session_id
+        self._project_id = project_id
+        self._inited_at = inited_at
+        self._environment = environment
+        self._plugins = plugins
+
+    @classmethod
+    def _fast_new(cls,
+                  session_id: str,
+                  created_at: int,
+                  project_id: str,
+                  inited_at: int,
+                  environment: EnvironmentInfo,
+                  plugins: List[PluginInfo]) -> "StartedTelemetryEvent":
+        """
+        Create the StartedTelemetryEvent from precomputed values, bypassing `__init__`.
+
+        The arguments are the same as for `__init__`, plus the creation timestamp.
+
+        :return: The created event.
+        """
+        self = object.__new__(cls)
+        self._session_id = session_id
+        self._created_at = created_at
         self._project_id = project_id
         self._inited_at = inited_at
         self._environment = environment
         self._plugins = plugins
+        return self
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -129,7 +188,7 @@ class StartedTelemetryEvent(TelemetryEvent):
         :return: A dictionary representing the event.
         """
         return {
-            "event_id": f"{self.__class__.__name__}",
+            "event_id": self._event_id,
             "session_id": self._session_id,
             "created_at": self._created_at,
             "project_id": self._project_id,
@@ -138,13 +197,44 @@ class StartedTelemetryEvent(TelemetryEvent):
             "plugins": self._plugins,
         }
 
+    def to_tuple(self) -> Tuple[Any, ...]:
+        """
+        Convert the StartedTelemetryEvent into a tuple of values in the order of `fields`.
+
+        :return: A tuple representing the event.
+        """
+        return (
+            self._event_id,
+            self._session_id,
+            self._created_at,
+            self._project_id,
+            self._inited_at,
+            self._environment,
+            self._plugins,
+        )
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        Pickle the StartedTelemetryEvent as a call to `_fast_new` with its values.
+
+        :return: A tuple of the reconstructor and its arguments.
+        """
+        return (self.__class__._fast_new, (
+            self._session_id,
+            self._created_at,
+            self._project_id,
+            self._inited_at,
+            self._environment,
+            self._plugins,
+        ))
+
     def __repr__(self) -> str:
         """
         Return a string representation of the StartedTelemetryEvent.
 
         :return: A string describing the event.
         """
-        return (f"<{self.__class__.__name__} session_id={self._session_id!r} "
+        return (f"<{self._cls_name} session_id={self._session_id!r} "
                 f"project_id={self._project_id!r}>")
 
 
@@ -155,7 +245,10 @@ class ArgParseTelemetryEvent(TelemetryEvent):
     This event stores the session ID and the parsed command-line arguments.
     """
 
-    def __init__(self, session_id: UUID, cmd: List[str]) -> None:
+    __slots__ = ("_session_id", "_cmd",)
+    fields = ("event_id", "session_id", "created_at", "cmd",)
+
+    def __init__(self, session_id: str, cmd: List[str]) -> None:
         """
         Initialize the ArgParseTelemetryEvent with session ID and command-line arguments.
 
@@ -163,8 +256,26 @@ class ArgParseTelemetryEvent(TelemetryEvent):
         :param cmd: A list of parsed command-line arguments.
         """
         super().__init__()
-        self._session_id = str(session_id)
+        self._session_id = session_id
+        self._cmd = cmd
+
+    @classmethod
+    def _fast_new(cls,
+                  session_id: str,
+                  created_at: int,
+                  cmd: List[str]) -> "ArgParseTelemetryEvent":
+        """
+        Create the ArgParseTelemetryEvent from precomputed values, bypassing `__init__`.
+
+        The arguments are the same as for `__init__`, plus the creation timestamp.
+
+        :return: The created event.
+        """
+        self = object.__new__(cls)
+        self._session_id = session_id
+        self._created_at = created_at
         self._cmd = cmd
+        return self
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -173,19 +284,44 @@ class ArgParseTelemetryEvent(TelemetryEvent):
         :return: A dictionary representing the event.
         """
         return {
-            "event_id": f"{self.__class__.__name__}",
+            "event_id": self._event_id,
             "session_id": self._session_id,
             "created_at": self._created_at,
             "cmd": self._cmd
         }
 
+    def to_tuple(self) -> Tuple[Any, ...]:
+        """
+        Convert the ArgParseTelemetryEvent into a tuple of values in the order of `fields`.
+
+        :return: A tuple representing the event.
+        """
+        return (
+            self._event_id,
+            self._session_id,
+            self._created_at,
+            self._cmd,
+        )
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        Pickle the ArgParseTelemetryEvent as a call to `_fast_new` with its values.
+
+        :return: A tuple of the reconstructor and its arguments.
+        """
+        return (self.__class__._fast_new, (
+            self._session_id,
+            self._created_at,
+            self._cmd,
+        ))
+
     def __repr__(self) -> str:
         """
         Return a string representation of the ArgParseTelemetryEvent.
 
         :return: A string describing the event.
         """
-        return f"<{self.__class__.__name__} session_id={self._session_id!r} cmd={self._cmd!r}>"
+        return f"<{self._cls_name} session_id={self._session_id!r} cmd={self._cmd!r}>"
 
 
 class ArgParsedTelemetryEvent(TelemetryEvent):
@@ -195,7 +331,10 @@ class ArgParsedTelemetryEvent(TelemetryEvent):
     This event stores the session ID and the parsed arguments as a dictionary.
     """
 
-    def __init__(self, session_id: UUID, args: Dict[str, Any]) -> None:
+    __slots__ = ("_session_id", "_args",)
+    fields = ("event_id", "session_id", "created_at", "args",)
+
+    def __init__(self, session_id: str, args: Dict[str, Any]) -> None:
         """
         Initialize the ArgParsedTelemetryEvent with session ID and parsed arguments.
 
@@ -203,8 +342,26 @@ class ArgParsedTelemetryEvent(TelemetryEvent):
         :param args: A dictionary of parsed command-line arguments.
         """
         super().__init__()
-        self._session_id = str(session_id)
+        self._session_id = session_id
+        self._args = args
+
+    @classmethod
+    def _fast_new(cls,
+                  session_id: str,
+                  created_at: int,
+                  args: Dict[str, Any]) -> "ArgParsedTelemetryEvent":
+        """
+        Create the ArgParsedTelemetryEvent from precomputed values, bypassing `__init__`.
+
+        The arguments are the same as for `__init__`, plus the creation timestamp.
+
+        :return: The created event.
+        """
+        self = object.__new__(cls)
+        self._session_id = session_id
+        self._created_at = created_at
         self._args = args
+        return self
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -213,19 +370,44 @@ class ArgParsedTelemetryEvent(TelemetryEvent):
         :return: A dictionary representing the event.
         """
         return {
-            "event_id": f"{self.__class__.__name__}",
+            "event_id": self._event_id,
             "session_id": self._session_id,
             "created_at": self._created_at,
             "args": self._args
         }
 
+    def to_tuple(self) -> Tuple[Any, ...]:
+        """
+        Convert the ArgParsedTelemetryEvent into a tuple of values in the order of `fields`.
+
+        :return: A tuple representing the event.
+        """
+        return (
+            self._event_id,
+            self._session_id,
+            self._created_at,
+            self._args,
+        )
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        Pickle the ArgParsedTelemetryEvent as a call to `_fast_new` with its values.
+
+        :return: A tuple of the reconstructor and its arguments.
+        """
+        return (self.__class__._fast_new, (
+            self._session_id,
+            self._created_at,
+            self._args,
+        ))
+
     def __repr__(self) -> str:
         """
         Return a string representation of the ArgParsedTelemetryEvent.
 
         :return: A string describing the event.
         """
-        return f"<{self.__class__.__name__} session_id={self._session_id!r} args={self._args!r}>"
+        return f"<{self._cls_name} session_id={self._session_id!r} args={self._args!r}>"
 
 
 class StartupTelemetryEvent(TelemetryEvent):
@@ -235,7 +417,10 @@ class StartupTelemetryEvent(TelemetryEvent):
     This event stores the session ID, the number of discovered and scheduled scenarios.
     """
 
-    def __init__(self, session_id: UUID, discovered: int, scheduled: int) -> None:
+    __slots__ = ("_session_id", "_discovered", "_scheduled",)
+    fields = ("event_id", "session_id", "created_at", "discovered", "scheduled",)
+
+    def __init__(self, session_id: str, discovered: int, scheduled: int) -> None:
         """
         Initialize the StartupTelemetryEvent with session ID, discovered, and scheduled counts.
 
@@ -244,9 +429,29 @@ class StartupTelemetryEvent(TelemetryEvent):
         :param scheduled: The number of scenarios scheduled.
         """
         super().__init__()
-        self._session_id = str(session_id)
+        self._session_id = session_id
+        self._discovered = discovered
+        self._scheduled = scheduled
+
+    @classmethod
+    def _fast_new(cls,
+                  session_id: str,
+                  created_at: int,
+                  discovered: int,
+                  scheduled: int) -> "StartupTelemetryEvent":
+        """
+        Create the StartupTelemetryEvent from precomputed values, bypassing `__init__`.
+
+        The arguments are the same as for `__init__`, plus the creation timestamp.
+
+        :return: The created event.
+        """
+        self = object.__new__(cls)
+        self._session_id = session_id
+        self._created_at = created_at
         self._discovered = discovered
         self._scheduled = scheduled
+        return self
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -255,20 +460,47 @@ class StartupTelemetryEvent(TelemetryEvent):
         :return: A dictionary representing the event.
         """
         return {
-            "event_id": f"{self.__class__.__name__}",
+            "event_id": self._event_id,
             "session_id": self._session_id,
             "created_at": self._created_at,
             "discovered": self._discovered,
             "scheduled": self._scheduled
         }
 
+    def to_tuple(self) -> Tuple[Any, ...]:
+        """
+        Convert the StartupTelemetryEvent into a tuple of values in the order of `fields`.
+
+        :return: A tuple representing the event.
+        """
+        return (
+            self._event_id,
+            self._session_id,
+            self._created_at,
+            self._discovered,
+            self._scheduled,
+        )
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        Pickle the StartupTelemetryEvent as a call to `_fast_new` with its values.
+
+        :return: A tuple of the reconstructor and its arguments.
+        """
+        return (self.__class__._fast_new, (
+            self._session_id,
+            self._created_at,
+            self._discovered,
+            self._scheduled,
+        ))
+
     def __repr__(self) -> str:
         """
         Return a string representation of the StartupTelemetryEvent.
 
         :return: A string describing the event.
         """
-        return (f"<{self.__class__.__name__} session_id={self._session_id!r} "
+        return (f"<{self._cls_name} session_id={self._session_id!r} "
                 f"discovered={self._discovered} scheduled={self._scheduled!r}>")
 
 
@@ -279,7 +511,11 @@ class ExcRaisedTelemetryEvent(TelemetryEvent):
     This event stores the session ID, scenario ID, and details about the raised exception.
     """
 
-    def __init__(self, session_id: UUID, scenario_id: str, exception: ExceptionInfo) -> None:
+    __slots__ = ("_session_id", "_scenario_id", "_exception",)
+    fields = ("event_id", "session_id", "created_at", "scenario_id", "exception",)
+
+    def __init__(self, session_id: str,
+                 scenario_id: str, exception: ExceptionInfo) -> None:
         """
         Initialize the ExcRaisedTelemetryEvent with session ID, scenario ID, and exception details.
 
@@ -288,9 +524,29 @@ class ExcRaisedTelemetryEvent(TelemetryEvent):
         :param exception: Details about the raised exception.
         """
         super().__init__()
-        self._session_id = str(session_id)
+        self._session_id = session_id
+        self._scenario_id = scenario_id
+        self._exception = exception
+
+    @classmethod
+    def _fast_new(cls,
+                  session_id: str,
+                  created_at: int,
+                  scenario_id: str,
+                  exception: ExceptionInfo) -> "ExcRaisedTelemetryEvent":
+        """
+        Create the ExcRaisedTelemetryEvent from precomputed values, bypassing `__init__`.
+
+        The arguments are the same as for `__init__`, plus the creation timestamp.
+
+        :return: The created event.
+        """
+        self = object.__new__(cls)
+        self._session_id = session_id
+        self._created_at = created_at
         self._scenario_id = scenario_id
         self._exception = exception
+        return self
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -299,20 +555,47 @@ class ExcRaisedTelemetryEvent(TelemetryEvent):
         :return: A dictionary representing the event.
         """
         return {
-            "event_id": f"{self.__class__.__name__}",
+            "event_id": self._event_id,
             "session_id": self._session_id,
             "created_at": self._created_at,
             "scenario_id": self._scenario_id,
             "exception": self._exception,
         }
 
+    def to_tuple(self) -> Tuple[Any, ...]:
+        """
+        Convert the ExcRaisedTelemetryEvent into a tuple of values in the order of `fields`.
+
+        :return: A tuple representing the event.
+        """
+        return (
+            self._event_id,
+            self._session_id,
+            self._created_at,
+            self._scenario_id,
+            self._exception,
+        )
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        Pickle the ExcRaisedTelemetryEvent as a call to `_fast_new` with its values.
+
+        :return: A tuple of the reconstructor and its arguments.
+        """
+        return (self.__class__._fast_new, (
+            self._session_id,
+            self._created_at,
+            self._scenario_id,
+            self._exception,
+        ))
+
     def __repr__(self) -> str:
         """
         Return a string representation of the ExcRaisedTelemetryEvent.
 
         :return: A string describing the event.
         """
-        return (f"<{self.__class__.__name__} session_id={self._session_id!r} "
+        return (f"<{self._cls_name} session_id={self._session_id!r} "
                 f"scenario_id={self._scenario_id!r} exc_type={self._exception['type']!r}>")
 
 
@@ -320,16 +603,23 @@ class EndedTelemetryEvent(TelemetryEvent):
     """
     Represents the event when a telemetry session ends.
 
-    This event stores the session ID, the total number of scenarios, and the count of
-    passed, failed, skipped, and interrupted scenarios.
+    This event stores the session ID, the total number of scenarios, the count of
+    passed, failed, skipped, and interrupted scenarios, and the number of telemetry
+    events dropped because the buffer overflowed.
     """
 
-    def __init__(self, session_id: UUID, *,
+    __slots__ = ("_session_id", "_total", "_passed", "_failed", "_skipped", "_interrupted",
+                 "_dropped_events",)
+    fields = ("event_id", "session_id", "created_at", "total", "passed", "failed", "skipped",
+              "interrupted", "dropped_events",)
+
+    def __init__(self, session_id: str, *,
                  total: int,
                  passed: int,
                  failed: int,
                  skipped: int,
-                 interrupted: Union[ExceptionInfo, None]) -> None:
+                 interrupted: Union[ExceptionInfo, None],
+                 dropped_events: int = 0) -> None:
         """
         Initialize the EndedTelemetryEvent with session ID and scenario results.
 
@@ -339,14 +629,44 @@ class EndedTelemetryEvent(TelemetryEvent):
         :param failed: The number of scenarios that failed.
         :param skipped: The number of scenarios that were skipped.
         :param interrupted: Information about an exception if the session was interrupted.
+        :param dropped_events: The number of telemetry events dropped during the session.
         """
         super().__init__()
-        self._session_id = str(session_id)
+        self._session_id = session_id
         self._total = total
         self._passed = passed
         self._failed = failed
         self._skipped = skipped
         self._interrupted = interrupted
+        self._dropped_events = dropped_events
+
+    @classmethod
+    def _fast_new(cls,
+                  session_id: str,
+                  created_at: int,
+                  total: int,
+                  passed: int,
+                  failed: int,
+                  skipped: int,
+                  interrupted: Union[ExceptionInfo, None],
+                  dropped_events: int) -> "EndedTelemetryEvent":
+        """
+        Create the EndedTelemetryEvent from precomputed values, bypassing `__init__`.
+
+        The arguments are the same as for `__init__`, plus the creation timestamp.
+
+        :return: The created event.
+        """
+        self = object.__new__(cls)
+        self._session_id = session_id
+        self._created_at = created_at
+        self._total = total
+        self._passed = passed
+        self._failed = failed
+        self._skipped = skipped
+        self._interrupted = interrupted
+        self._dropped_events = dropped_events
+        return self
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -355,7 +675,7 @@ class EndedTelemetryEvent(TelemetryEvent):
         :return: A dictionary representing the event.
         """
         return {
-            "event_id": f"{self.__class__.__name__}",
+            "event_id": self._event_id,
             "session_id": self._session_id,
             "created_at": self._created_at,
             "total": self._total,
@@ -363,8 +683,44 @@ class EndedTelemetryEvent(TelemetryEvent):
             "failed": self._failed,
             "skipped": self._skipped,
             "interrupted": self._interrupted,
+            "dropped_events": self._dropped_events,
         }
 
+    def to_tuple(self) -> Tuple[Any, ...]:
+        """
+        Convert the EndedTelemetryEvent into a tuple of values in the order of `fields`.
+
+        :return: A tuple representing the event.
+        """
+        return (
+            self._event_id,
+            self._session_id,
+            self._created_at,
+            self._total,
+            self._passed,
+            self._failed,
+            self._skipped,
+            self._interrupted,
+            self._dropped_events,
+        )
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        Pickle the EndedTelemetryEvent as a call to `_fast_new` with its values.
+
+        :return: A tuple of the reconstructor and its arguments.
+        """
+        return (self.__class__._fast_new, (
+            self._session_id,
+            self._created_at,
+            self._total,
+            self._passed,
+            self._failed,
+            self._skipped,
+            self._interrupted,
+            self._dropped_events,
+        ))
+
     def __repr__(self) -> str:
         """
         Return a string representation of the EndedTelemetryEvent.
@@ -372,6 +728,6 @@ class EndedTelemetryEvent(TelemetryEvent):
         :return: A string describing the event.
         """
         is_interrupted = self._interrupted is not None
-        return (f"<{self.__class__.__name__} session_id={self._session_id!r} "
+        return (f"<{self._cls_name} session_id={self._session_id!r} "
                 f"total={self._total} passed={self._passed} failed={self._failed} "
                 f"skipped={self._skipped} is_interrupted={is_interrupted!r}>")